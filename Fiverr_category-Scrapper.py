@@ -1,9 +1,8 @@
-import json
 import argparse
 import sys
 import os
 import re
-import time
+import traceback
 import importlib.util
 from pathlib import Path
 from urllib.parse import urlparse, parse_qs, urlencode, urlunparse
@@ -29,7 +28,11 @@ _spec.loader.exec_module(_search_mod)
 
 sanitize_filename         = _search_mod.sanitize_filename
 extract_gig_urls_from_search = _search_mod.extract_gig_urls_from_search
-scrape_gig_details        = _search_mod.scrape_gig_details
+scrape_gigs               = _search_mod.scrape_gigs
+wait_for_request_slot     = _search_mod.wait_for_request_slot
+worker_count              = _search_mod.worker_count
+DEFAULT_WORKERS           = _search_mod.DEFAULT_WORKERS
+DEBUG                     = _search_mod.DEBUG
 
 
 # ---------------------------------------------------------------------------
@@ -89,7 +92,7 @@ def has_more_pages(page_data):
 # ---------------------------------------------------------------------------
 
 def scrape_category(category_url, api_key=None, output_dir='gigs_data',
-                    max_pages=1, delay=2):
+                    max_pages=1, delay=2, workers=DEFAULT_WORKERS, ndjson=False):
     """Scrape gigs from a Fiverr category URL."""
 
     if not api_key:
@@ -121,8 +124,7 @@ def scrape_category(category_url, api_key=None, output_dir='gigs_data',
         url = build_page_url(category_url, page)
         print(f"\n📄 Scraping category page {page}...")
 
-        if page > 1:
-            time.sleep(delay)
+        wait_for_request_slot(delay)
 
         try:
             response  = session.get(url)
@@ -150,8 +152,8 @@ def scrape_category(category_url, api_key=None, output_dir='gigs_data',
             sys.exit(1)
         except Exception as e:
             print(f"  ❌ Error on page {page}: {e}")
-            import traceback
-            traceback.print_exc()
+            if DEBUG:
+                traceback.print_exc()
             break
 
     print(f"\n✅ Total gigs collected: {len(all_gig_infos)}")
@@ -165,27 +167,8 @@ def scrape_category(category_url, api_key=None, output_dir='gigs_data',
     # ------------------------------------------------------------------
     # Phase 2 — scrape each individual gig detail page
     # ------------------------------------------------------------------
-    scraped_count = 0
-
-    for idx, gig_info in enumerate(all_gig_infos, 1):
-        print(f"\n[{idx}/{len(all_gig_infos)}] Processing gig...")
-        print(f"  📌 {gig_info['title'][:60]}...")
-
-        gig_details = scrape_gig_details(gig_info, delay=delay)
-
-        if gig_details:
-            gig_id      = gig_info.get('gig_id', idx)
-            seller_name = sanitize_filename(gig_info.get('seller_name', 'unknown'))
-            filename    = f"gig_{gig_id}_{seller_name}.json"
-            filepath    = out_dir / filename
-
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(gig_details, f, indent=2, ensure_ascii=False)
-
-            print(f"  ✅ Saved: {filename}")
-            scraped_count += 1
-        else:
-            print(f"  ⚠️  Skipped (no data)")
+    scraped_count = scrape_gigs(all_gig_infos, out_dir, delay=delay, workers=workers,
+                                ndjson=ndjson)
 
     print("\n" + "=" * 60)
     print(f"🎉 Category scrape complete!")
@@ -217,6 +200,10 @@ Examples:
     parser.add_argument('--output', '-o', default='gigs_data', help='Output directory (default: gigs_data)')
     parser.add_argument('--pages',  '-p', type=int, default=1,  help='Pages to scrape (default: 1)')
     parser.add_argument('--delay',  '-d', type=int, default=2,  help='Seconds between requests (default: 2)')
+    parser.add_argument('--workers', '-w', type=worker_count, default=DEFAULT_WORKERS,
+                        help=f'Gig pages to fetch in parallel (default: {DEFAULT_WORKERS})')
+    parser.add_argument('--ndjson', action='store_true',
+                        help='Append gigs to one gigs.ndjson file instead of one JSON file per gig')
 
     args = parser.parse_args()
 
@@ -231,6 +218,8 @@ Examples:
         output_dir=args.output,
         max_pages=args.pages,
         delay=args.delay,
+        workers=args.workers,
+        ndjson=args.ndjson,
     )
 
 
@@ -1,13 +1,17 @@
-import json
 import argparse
 import sys
 import os
 import re
 import time
+import threading
+import traceback
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import nullcontext
 from pathlib import Path
 from urllib.parse import quote_plus
 from fiverr import session
 from fiverr.utils.req import ScraperApiKeyError, ScraperApiQuotaError, ScraperApiError
+from fiverr.utils.json_utils import dumps
 
 try:
     from dotenv import load_dotenv
@@ -16,14 +20,173 @@ except ImportError:
     pass
 
 
+# Full tracebacks for unexpected errors are only printed when
+# FIVERR_SCRAPER_DEBUG is set; the one-line error message is always shown.
+DEBUG = bool(os.environ.get('FIVERR_SCRAPER_DEBUG'))
+
+# Gig detail pages fetched in parallel. Kept below ScraperAPI's free-plan
+# limit of 5 concurrent requests.
+DEFAULT_WORKERS = 4
+
+# Shared default for missing nested objects in the Fiverr JSON. Only ever
+# read from -- never mutate it or store it in the extracted output.
+_EMPTY = {}
+
+# Characters that are not allowed in Windows filenames
+_INVALID_FILENAME_CHARS = re.compile(r'[<>:"/\\|?*]')
+_INVALID_FILENAME_CHAR_SET = frozenset('<>:"/\\|?*')
+
+# Single-file output used by --ndjson: one compact gig JSON per line
+NDJSON_FILENAME = 'gigs.ndjson'
+
+_request_slot_lock = threading.Lock()
+_next_request_at = 0.0
+
+# Set on the first fatal ScraperAPI error in a gig worker (or when the run
+# is interrupted) so the remaining workers stop quietly
+_scrape_aborted = threading.Event()
+_scrape_abort_lock = threading.Lock()
+
+
+def wait_for_request_slot(delay):
+    """
+    Block until the next request slot is free. Slots are spaced `delay`
+    seconds apart and shared by all threads, so concurrent workers still
+    send at most one request every `delay` seconds overall.
+    """
+    global _next_request_at
+    with _request_slot_lock:
+        now = time.monotonic()
+        slot = max(now, _next_request_at)
+        _next_request_at = slot + delay
+    if slot > now:
+        time.sleep(slot - now)
+
+
+def _abort_scrape(message):
+    """
+    Report a fatal SCRAPER_ERROR from a gig worker and exit. Only the first
+    worker to fail prints, so the UI shows a single alert per run.
+    """
+    with _scrape_abort_lock:
+        first = not _scrape_aborted.is_set()
+        _scrape_aborted.set()
+    if first:
+        print(message)
+    sys.exit(1)
+
+
+def worker_count(value):
+    """argparse type for --workers: an integer of at least 1."""
+    workers = int(value)
+    if workers < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {workers}")
+    return workers
+
+
 def sanitize_filename(filename):
     """Remove/replace invalid characters for Windows filenames."""
-    invalid_chars = r'[<>:"/\\|?*]'
-    sanitized = re.sub(invalid_chars, '_', filename)
-    sanitized = sanitized.strip('. ')
+    # Most keywords and slugs are already clean; skip the regex for those
+    if _INVALID_FILENAME_CHAR_SET.isdisjoint(filename):
+        sanitized = filename.strip('. ')
+    else:
+        sanitized = _INVALID_FILENAME_CHARS.sub('_', filename).strip('. ')
     return sanitized[:100]
 
 
+# Flat fields copied from the gig page JSON, as
+# (output key, Fiverr key, default) triples. Defaults are shared by every
+# gig, so they must be immutable (an empty tuple serializes as []).
+_GENERAL_FIELDS = (
+    ('gig_id', 'gigId', ''),
+    ('category_name', 'categoryName', ''),
+    ('sub_category_name', 'subCategoryName', ''),
+    ('is_pro', 'isPro', False),
+    ('is_on_vacation', 'isOnVacation', False),
+)
+
+_GIG_OVERVIEW_FIELDS = (
+    ('rating', 'rating', 0),
+    ('ratings_count', 'ratingsCount', 0),
+    ('is_restricted', 'isRestrictedByRegion', False),
+)
+
+_SELLER_OVERVIEW_FIELDS = (
+    ('seller_id', 'id', ''),
+    ('username', 'username', ''),
+    ('is_pro', 'isPro', False),
+    ('country_code', 'countryCode', ''),
+    ('profile_photo', 'profilePhoto', ''),
+    ('proficient_languages', 'proficientLanguages', ()),
+    ('achievement', 'achievement', 0),
+)
+
+_SELLER_CARD_FIELDS = (
+    ('one_liner', 'oneLiner', ''),
+    ('rating', 'rating', 0),
+    ('ratings_count', 'ratingsCount', 0),
+    ('member_since', 'memberSince', ''),
+    ('response_time', 'responseTime', 0),
+    ('recent_delivery', 'recentDelivery', ''),
+    ('description', 'description', ''),
+    ('pro_sub_categories', 'proSubCategories', ()),
+)
+
+
+def _copy_fields(source, fields):
+    """Copy the (output key, Fiverr key, default) `fields` out of `source`."""
+    return {key: source.get(src_key, default) for key, src_key, default in fields}
+
+
+def _feature_info(feature):
+    """Flatten one package feature (price converted from cents)."""
+    get = feature.get
+    price = get('price', 0)
+    return {
+        'id': get('id', ''),
+        'name': get('name', ''),
+        'label': get('label', ''),
+        'value': get('value', 0),
+        'included': get('included', False),
+        'type': get('type', ''),
+        'price': price / 100 if price > 0 else 0
+    }
+
+
+def _review_info(review):
+    """Flatten one review, with the seller's response if there is one."""
+    get = review.get
+    seller_response = get('seller_response') or _EMPTY
+    return {
+        'id': get('id', ''),
+        'comment': get('comment', ''),
+        'rating': get('value', 0),
+        'username': get('username', ''),
+        'country': get('reviewer_country', ''),
+        'country_code': get('reviewer_country_code', ''),
+        'created_at': get('created_at', ''),
+        'seller_response': {
+            'comment': seller_response.get('comment', ''),
+            'created_at': seller_response.get('created_at', '')
+        } if seller_response else None
+    }
+
+
+def _slide_info(slide):
+    """Flatten one gallery slide and its media URLs."""
+    get = (slide.get('slide') or _EMPTY).get
+    media = get('media') or _EMPTY
+    return {
+        'name': get('name', ''),
+        'src': get('src', ''),
+        'thumbnail': get('thumbnail', ''),
+        'is_video': get('typeVideo', False),
+        'media_small': media.get('small', ''),
+        'media_medium': media.get('medium', ''),
+        'media_original': media.get('original', '')
+    }
+
+
 def extract_gig_urls_from_search(search_data):
     """Extract all gig URLs from search results JSON data."""
     gig_infos = []
@@ -56,7 +219,7 @@ def extract_gig_urls_from_search(search_data):
                     'gig_id': gig.get('gig_id', ''),
                     'price': gig.get('price_i', 0),
                     'seller_level': gig.get('seller_level', ''),
-                    'seller_rating': gig.get('seller_rating', {}).get('score', 0),
+                    'seller_rating': (gig.get('seller_rating') or _EMPTY).get('score', 0),
                     'seller_country': gig.get('seller_country', '')
                 }
                 
@@ -66,16 +229,17 @@ def extract_gig_urls_from_search(search_data):
         
     except Exception as e:
         print(f"❌ Error extracting gig URLs: {e}")
-        import traceback
-        traceback.print_exc()
+        if DEBUG:
+            traceback.print_exc()
     
     return gig_infos
 
 
-def extract_gig_details(gig_data):
+def extract_gig_details(gig_data, log=print):
     """
     Extract detailed information from a gig's JSON data.
     FIXED with correct paths from actual Fiverr response.
+    Progress lines go to `log` (print by default).
     """
     details = {
         'title': None,
@@ -96,58 +260,37 @@ def extract_gig_details(gig_data):
     
     try:
         # === GENERAL INFO ===
-        general = gig_data.get('general', {})
-        details['gig_info']['gig_id'] = general.get('gigId', '')
-        details['gig_info']['category_name'] = general.get('categoryName', '')
-        details['gig_info']['sub_category_name'] = general.get('subCategoryName', '')
-        details['gig_info']['is_pro'] = general.get('isPro', False)
-        details['gig_info']['is_on_vacation'] = general.get('isOnVacation', False)
+        general = gig_data.get('general') or _EMPTY
+        details['gig_info'].update(_copy_fields(general, _GENERAL_FIELDS))
         
         # === OVERVIEW SECTION ===
-        overview = gig_data.get('overview', {})
-        gig_overview = overview.get('gig', {})
+        overview = gig_data.get('overview') or _EMPTY
+        gig_overview = overview.get('gig') or _EMPTY
         
         details['title'] = gig_overview.get('title', '')
-        details['gig_info']['rating'] = gig_overview.get('rating', 0)
-        details['gig_info']['ratings_count'] = gig_overview.get('ratingsCount', 0)
         details['orders_in_queue'] = gig_overview.get('ordersInQueue', 0)
-        details['gig_info']['is_restricted'] = gig_overview.get('isRestrictedByRegion', False)
+        details['gig_info'].update(_copy_fields(gig_overview, _GIG_OVERVIEW_FIELDS))
         
         # Categories from overview
-        categories = overview.get('categories', {})
+        categories = overview.get('categories') or _EMPTY
         if categories:
             details['gig_info']['category'] = categories.get('category', {})
             details['gig_info']['sub_category'] = categories.get('subCategory', {})
             details['gig_info']['nested_sub_category'] = categories.get('nestedSubCategory', {})
         
         # Seller overview info
-        seller_overview = overview.get('seller', {})
+        seller_overview = overview.get('seller') or _EMPTY
         if seller_overview:
-            details['seller_info']['seller_id'] = seller_overview.get('id', '')
-            details['seller_info']['username'] = seller_overview.get('username', '')
-            details['seller_info']['is_pro'] = seller_overview.get('isPro', False)
-            details['seller_info']['country_code'] = seller_overview.get('countryCode', '')
-            details['seller_info']['profile_photo'] = seller_overview.get('profilePhoto', '')
-            details['seller_info']['proficient_languages'] = seller_overview.get('proficientLanguages', [])
-            details['seller_info']['achievement'] = seller_overview.get('achievement', 0)
+            details['seller_info'].update(_copy_fields(seller_overview, _SELLER_OVERVIEW_FIELDS))
         
         # === SELLER CARD (Additional seller info) ===
-        seller_card = gig_data.get('sellerCard', {})
+        seller_card = gig_data.get('sellerCard') or _EMPTY
         if seller_card:
-            details['seller_info'].update({
-                'one_liner': seller_card.get('oneLiner', ''),
-                'rating': seller_card.get('rating', 0),
-                'ratings_count': seller_card.get('ratingsCount', 0),
-                'member_since': seller_card.get('memberSince', ''),
-                'response_time': seller_card.get('responseTime', 0),
-                'recent_delivery': seller_card.get('recentDelivery', ''),
-                'description': seller_card.get('description', ''),
-                'pro_sub_categories': seller_card.get('proSubCategories', [])
-            })
+            details['seller_info'].update(_copy_fields(seller_card, _SELLER_CARD_FIELDS))
         
         # === DESCRIPTION (FIXED PATH) ===
         # CRITICAL FIX: Description is at description.content, NOT in aboutGig.sections
-        description_obj = gig_data.get('description', {})
+        description_obj = gig_data.get('description') or _EMPTY
         if description_obj:
             # Full description (HTML content)
             details['description'] = description_obj.get('content', '')
@@ -156,10 +299,10 @@ def extract_gig_details(gig_data):
             metadata_attrs = description_obj.get('metadataAttributes', [])
             details['metadata'] = metadata_attrs
             
-            print("  ✅ Description extracted successfully")
+            log("  ✅ Description extracted successfully")
         
         # === FAQS ===
-        faqs_data = gig_data.get('faqs', {})
+        faqs_data = gig_data.get('faqs') or _EMPTY
         faqs_list = faqs_data.get('list', [])
         if faqs_list:
             details['faqs'] = [
@@ -169,28 +312,29 @@ def extract_gig_details(gig_data):
                 }
                 for faq in faqs_list
             ]
-            print(f"  ✅ Found {len(details['faqs'])} FAQs")
+            log(f"  ✅ Found {len(details['faqs'])} FAQs")
         
         # === PACKAGES (FIXED PATH) ===
         # CRITICAL FIX: Packages are at packages.packageList[], NOT packages.packages[]
-        packages_data = gig_data.get('packages', {})
+        packages_data = gig_data.get('packages') or _EMPTY
         packages_list = packages_data.get('packageList', [])  # FIXED: was 'packages', now 'packageList'
         
         if packages_list:
-            print(f"  ✅ Found {len(packages_list)} packages")
+            log(f"  ✅ Found {len(packages_list)} packages")
             
             package_names = ['Basic', 'Standard', 'Premium']
             for idx, package in enumerate(packages_list):
-                revisions_data = package.get('revisions', {})
-                extra_fast = package.get('extraFast', {})
+                get = package.get
+                revisions_data = get('revisions') or _EMPTY
+                extra_fast = get('extraFast') or _EMPTY
                 
                 package_info = {
-                    'id': package.get('id', idx + 1),
+                    'id': get('id', idx + 1),
                     'name': package_names[idx] if idx < len(package_names) else f'Package {idx+1}',
-                    'title': package.get('title', ''),
-                    'description': package.get('description', ''),
-                    'price': package.get('price', 0) / 100,  # Convert from cents to dollars
-                    'delivery_time_days': package.get('duration', 0) / 24,  # Convert hours to days
+                    'title': get('title', ''),
+                    'description': get('description', ''),
+                    'price': get('price', 0) / 100,  # Convert from cents to dollars
+                    'delivery_time_days': get('duration', 0) / 24,  # Convert hours to days
                     'revisions': revisions_data.get('value', 0),
                     'revisions_unlimited': revisions_data.get('value', 0) == -1,
                     'extra_fast_delivery': {
@@ -198,25 +342,13 @@ def extract_gig_details(gig_data):
                         'duration_hours': extra_fast.get('duration', 0) if extra_fast else 0,
                         'price': extra_fast.get('price', 0) / 100 if extra_fast else 0
                     },
-                    'features': []
+                    # Extract features
+                    'features': [_feature_info(feature) for feature in get('features', [])]
                 }
                 
-                # Extract features
-                features = package.get('features', [])
-                for feature in features:
-                    package_info['features'].append({
-                        'id': feature.get('id', ''),
-                        'name': feature.get('name', ''),
-                        'label': feature.get('label', ''),
-                        'value': feature.get('value', 0),
-                        'included': feature.get('included', False),
-                        'type': feature.get('type', ''),
-                        'price': feature.get('price', 0) / 100 if feature.get('price', 0) > 0 else 0
-                    })
-                
                 details['packages'].append(package_info)
         else:
-            print("  ⚠️  No packages found")
+            log("  ⚠️  No packages found")
         
         # === PRICING SUMMARY ===
         if details['packages']:
@@ -225,106 +357,85 @@ def extract_gig_details(gig_data):
                 details['pricing'] = {
                     'starting_price': min(prices),
                     'highest_price': max(prices),
-                    'currency': gig_data.get('currency', {}).get('name', 'USD'),
+                    'currency': (gig_data.get('currency') or _EMPTY).get('name', 'USD'),
                     'has_packages': True
                 }
         
         # === REVIEWS ===
-        reviews_data = gig_data.get('reviews', {})
+        reviews_data = gig_data.get('reviews') or _EMPTY
         if reviews_data:
             details['reviews'] = {
                 'rating': reviews_data.get('rating', 0),
                 'reviews_count': reviews_data.get('reviews_count', 0),
                 'breakdown': reviews_data.get('breakdown', []),
                 'star_summary': reviews_data.get('star_summary', {}),
-                'recent_reviews': []
+                'recent_reviews': [_review_info(review) for review in reviews_data.get('reviews', [])[:5]]
             }
-            
-            reviews_list = reviews_data.get('reviews', [])[:5]
-            for review in reviews_list:
-                seller_response = review.get('seller_response', {})
-                details['reviews']['recent_reviews'].append({
-                    'id': review.get('id', ''),
-                    'comment': review.get('comment', ''),
-                    'rating': review.get('value', 0),
-                    'username': review.get('username', ''),
-                    'country': review.get('reviewer_country', ''),
-                    'country_code': review.get('reviewer_country_code', ''),
-                    'created_at': review.get('created_at', ''),
-                    'seller_response': {
-                        'comment': seller_response.get('comment', ''),
-                        'created_at': seller_response.get('created_at', '')
-                    } if seller_response else None
-                })
         
         # === GALLERY ===
-        gallery_data = gig_data.get('gallery', {})
+        gallery_data = gig_data.get('gallery') or _EMPTY
         slides = gallery_data.get('slides', [])
         
-        for slide in slides:
-            slide_data = slide.get('slide', {})
-            media = slide_data.get('media', {})
-            details['gallery'].append({
-                'name': slide_data.get('name', ''),
-                'src': slide_data.get('src', ''),
-                'thumbnail': slide_data.get('thumbnail', ''),
-                'is_video': slide_data.get('typeVideo', False),
-                'media_small': media.get('small', ''),
-                'media_medium': media.get('medium', ''),
-                'media_original': media.get('original', '')
-            })
+        details['gallery'] = [_slide_info(slide) for slide in slides]
         
         # === TAGS ===
-        tags_data = gig_data.get('tags', {})
+        tags_data = gig_data.get('tags') or _EMPTY
         tags_list = tags_data.get('tagsGigList', [])
         
-        for tag in tags_list:
-            details['tags'].append({
+        details['tags'] = [
+            {
                 'name': tag.get('name', ''),
                 'slug': tag.get('slug', '')
-            })
+            }
+            for tag in tags_list
+        ]
         
         # === TOP NAV INFO ===
-        top_nav = gig_data.get('topNav', {})
+        top_nav = gig_data.get('topNav') or _EMPTY
         if top_nav:
             details['gig_info']['collected_count'] = top_nav.get('gigCollectedCount', 0)
         
         # === CURRENCY ===
-        currency_data = gig_data.get('currency', {})
+        currency_data = gig_data.get('currency') or _EMPTY
         if currency_data:
             details['pricing']['currency_symbol'] = currency_data.get('symbol', '$')
             details['pricing']['currency_template'] = currency_data.get('template', '${amount}')
         
         # Final status report
-        print(f"  📊 Extraction Summary:")
-        print(f"     - Title: {'✅' if details['title'] else '❌'}")
-        print(f"     - Description: {'✅' if details['description'] else '❌'}")
-        print(f"     - Packages: {'✅ (' + str(len(details['packages'])) + ')' if details['packages'] else '❌'}")
-        print(f"     - Orders in Queue: {'✅ (' + str(details['orders_in_queue']) + ')' if details['orders_in_queue'] is not None else '❌'}")
-        print(f"     - Reviews: ✅ ({len(details['reviews'].get('recent_reviews', []))})")
-        print(f"     - Gallery: ✅ ({len(details['gallery'])})")
+        log(f"  📊 Extraction Summary:")
+        log(f"     - Title: {'✅' if details['title'] else '❌'}")
+        log(f"     - Description: {'✅' if details['description'] else '❌'}")
+        log(f"     - Packages: {'✅ (' + str(len(details['packages'])) + ')' if details['packages'] else '❌'}")
+        log(f"     - Orders in Queue: {'✅ (' + str(details['orders_in_queue']) + ')' if details['orders_in_queue'] is not None else '❌'}")
+        log(f"     - Reviews: ✅ ({len(details['reviews'].get('recent_reviews', []))})")
+        log(f"     - Gallery: ✅ ({len(details['gallery'])})")
         
     except Exception as e:
-        print(f"  ⚠️  Error extracting gig details: {e}")
-        import traceback
-        traceback.print_exc()
+        log(f"  ⚠️  Error extracting gig details: {e}")
+        if DEBUG:
+            traceback.print_exc()
     
     return details
 
 
-def scrape_gig_details(gig_info, delay=2):
-    """Scrape detailed information from a single gig page."""
+def scrape_gig_details(gig_info, delay=2, log=print):
+    """
+    Scrape detailed information from a single gig page.
+    Progress lines go to `log`; a fatal SCRAPER_ERROR is printed directly.
+    """
     try:
-        time.sleep(delay)
+        wait_for_request_slot(delay)
+        if _scrape_aborted.is_set():
+            return None
         
         gig_url = gig_info['url']
-        print(f"  🔄 Scraping: {gig_url}")
+        log(f"  🔄 Scraping: {gig_url}")
         
         response = session.get(gig_url)
         gig_data = response.props_json()
         
         # Extract details
-        details = extract_gig_details(gig_data)
+        details = extract_gig_details(gig_data, log=log)
         details['raw_url'] = gig_url
         details['scraped_at'] = time.strftime('%Y-%m-%d %H:%M:%S')
         
@@ -341,23 +452,88 @@ def scrape_gig_details(gig_info, delay=2):
         return details
         
     except ScraperApiKeyError as e:
-        print(f"SCRAPER_ERROR:INVALID_KEY:{e}")
-        sys.exit(1)
+        _abort_scrape(f"SCRAPER_ERROR:INVALID_KEY:{e}")
     except ScraperApiQuotaError as e:
-        print(f"SCRAPER_ERROR:QUOTA_EXCEEDED:{e}")
-        sys.exit(1)
+        _abort_scrape(f"SCRAPER_ERROR:QUOTA_EXCEEDED:{e}")
     except ScraperApiError as e:
-        print(f"SCRAPER_ERROR:API_ERROR:{e}")
-        sys.exit(1)
+        _abort_scrape(f"SCRAPER_ERROR:API_ERROR:{e}")
     except Exception as e:
-        print(f"  ❌ Error scraping {gig_url}: {e}")
-        import traceback
-        traceback.print_exc()
+        log(f"  ❌ Error scraping {gig_url}: {e}")
+        if DEBUG:
+            traceback.print_exc()
         return None
 
 
+def _scrape_gig_buffered(gig_info, delay):
+    """
+    Pool worker: scrape one gig, collecting its progress lines instead of
+    printing them, so scrape_gigs can print each gig's log in one block.
+    """
+    lines = []
+    return scrape_gig_details(gig_info, delay, log=lines.append), lines
+
+
+def scrape_gigs(gig_infos, out_dir, delay=2, workers=DEFAULT_WORKERS, ndjson=False):
+    """
+    Scrape the detail page of every gig in `gig_infos` using a pool of
+    `workers` threads and save each result as JSON in `out_dir` -- one
+    file per gig, or one line per gig appended to gigs.ndjson when
+    `ndjson` is set. Returns the number of gigs saved.
+    """
+    total = len(gig_infos)
+    scraped_count = 0
+    ndjson_path = Path(out_dir) / NDJSON_FILENAME
+    
+    with (open(ndjson_path, 'ab') if ndjson else nullcontext()) as ndjson_file:
+        executor = ThreadPoolExecutor(max_workers=workers)
+        futures = {
+            executor.submit(_scrape_gig_buffered, gig_info, delay): (idx, gig_info)
+            for idx, gig_info in enumerate(gig_infos, 1)
+        }
+        try:
+            for done, future in enumerate(as_completed(futures), 1):
+                idx, gig_info = futures[future]
+                gig_details, log_lines = future.result()
+                
+                print(f"\n[{done}/{total}] Processed gig...")
+                print(f"  📌 {gig_info['title'][:60]}...")
+                if log_lines:
+                    print('\n'.join(log_lines))
+                
+                if gig_details and ndjson_file:
+                    # Flush per gig: each one has cost an API request, and a
+                    # stopped run (/api/stop, SIGTERM) must not lose them
+                    ndjson_file.write(dumps(gig_details) + b'\n')
+                    ndjson_file.flush()
+                    print(f"  ✅ Saved to: {NDJSON_FILENAME}")
+                    scraped_count += 1
+                elif gig_details:
+                    gig_id = gig_info.get('gig_id', idx)
+                    seller_name = sanitize_filename(gig_info.get('seller_name', 'unknown'))
+                    filename = f"gig_{gig_id}_{seller_name}.json"
+                    filepath = Path(out_dir) / filename
+                    
+                    with open(filepath, 'wb') as f:
+                        f.write(dumps(gig_details, pretty=True))
+                    
+                    print(f"  ✅ Saved: {filename}")
+                    scraped_count += 1
+                else:
+                    print(f"  ⚠️  Skipped (no data)")
+        except BaseException:
+            # A fatal ScraperAPI error (sys.exit in a worker) or Ctrl+C: drop
+            # the queued gigs and don't wait on requests already in flight;
+            # _scrape_aborted keeps those workers from reporting again
+            _scrape_aborted.set()
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise
+        executor.shutdown()
+    
+    return scraped_count
+
+
 def search_and_scrape_fiverr(keyword, api_key=None, output_dir="gigs_data", 
-                             max_pages=1, delay=2):
+                             max_pages=1, delay=2, workers=DEFAULT_WORKERS, ndjson=False):
     """Search Fiverr and scrape all gigs from results."""
     if not api_key:
         api_key = os.getenv('SCRAPER_API_KEY')
@@ -379,17 +555,16 @@ def search_and_scrape_fiverr(keyword, api_key=None, output_dir="gigs_data",
     print("=" * 60)
     
     all_gig_infos = []
+    encoded_keyword = quote_plus(keyword)
     
     # Scrape search results
     for page in range(1, max_pages + 1):
         try:
-            encoded_keyword = quote_plus(keyword)
             search_url = f"https://www.fiverr.com/search/gigs?query={encoded_keyword}&page={page}"
 
             print(f"\n📄 Scraping search results page {page}...")
 
-            if page > 1:
-                time.sleep(delay)
+            wait_for_request_slot(delay)
 
             response = session.get(search_url)
             search_data = response.props_json()
@@ -424,28 +599,8 @@ def search_and_scrape_fiverr(keyword, api_key=None, output_dir="gigs_data",
         sys.exit(1)
 
     # Scrape individual gigs
-    scraped_count = 0
-    
-    for idx, gig_info in enumerate(all_gig_infos, 1):
-        print(f"\n[{idx}/{len(all_gig_infos)}] Processing gig...")
-        title_preview = gig_info['title'][:60]
-        print(f"  📌 {title_preview}...")
-        
-        gig_details = scrape_gig_details(gig_info, delay=delay)
-        
-        if gig_details:
-            gig_id = gig_info.get('gig_id', idx)
-            seller_name = sanitize_filename(gig_info.get('seller_name', 'unknown'))
-            filename = f"gig_{gig_id}_{seller_name}.json"
-            filepath = keyword_dir / filename
-            
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(gig_details, f, indent=2, ensure_ascii=False)
-            
-            print(f"  ✅ Saved: {filename}")
-            scraped_count += 1
-        else:
-            print(f"  ⚠️  Skipped (no data)")
+    scraped_count = scrape_gigs(all_gig_infos, keyword_dir, delay=delay, workers=workers,
+                                ndjson=ndjson)
     
     print("\n" + "=" * 60)
     print(f"🎉 Scraping complete!")
@@ -473,6 +628,10 @@ Examples:
     parser.add_argument('--output', '-o', default='gigs_data', help='Output directory')
     parser.add_argument('--pages', '-p', type=int, default=1, help='Max pages to scrape')
     parser.add_argument('--delay', '-d', type=int, default=2, help='Delay between requests')
+    parser.add_argument('--workers', '-w', type=worker_count, default=DEFAULT_WORKERS,
+                        help=f'Gig pages to fetch in parallel (default: {DEFAULT_WORKERS})')
+    parser.add_argument('--ndjson', action='store_true',
+                        help='Append gigs to one gigs.ndjson file instead of one JSON file per gig')
     
     args = parser.parse_args()
     
@@ -487,7 +646,9 @@ Examples:
         api_key=args.key,
         output_dir=args.output,
         max_pages=args.pages,
-        delay=args.delay
+        delay=args.delay,
+        workers=args.workers,
+        ndjson=args.ndjson
     )
 
 
@@ -4,111 +4,148 @@ Extracts all important market research data from scraped gigs
 and consolidates into a single JSON file per keyword
 """
 
-import json
+import os
 from pathlib import Path
 from datetime import datetime
-from collections import defaultdict
+from collections import Counter
 import re
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
+from bisect import bisect_left
+from itertools import chain
+
+from fiverr.utils.json_utils import dumps, loads
+
+
+# Upper bounds (exclusive) of the price_ranges buckets, and their labels
+PRICE_RANGE_BOUNDS = (50, 100, 250, 500)
+PRICE_RANGE_LABELS = ('under_50', '50_to_100', '100_to_250', '250_to_500', 'over_500')
+
+# Single-file gig store written by the scrapers' --ndjson option
+NDJSON_FILENAME = 'gigs.ndjson'
+
+# Output buffer for the consolidated analysis file
+WRITE_BUFFER_SIZE = 1 << 20
+
+# Directories with at least this many gigs are processed in a process pool
+# (a gig takes well under a millisecond, so smaller runs lose to pool startup)
+PARALLEL_MIN_GIGS = 256
+
+# Read-only stand-in for absent or null nested objects in a scraped gig
+_EMPTY = {}
+
+_TAG_RE = re.compile(r'<[^>]+>')
+
+
+def _plain(text):
+    """
+    Strip HTML tags from `text` and collapse runs of whitespace.
+    str.split() splits on exactly the characters r'\s' matches, so the
+    split/join does the whitespace collapse and strip in a single C pass.
+    """
+    if '<' in text:
+        text = _TAG_RE.sub('', text)
+    return ' '.join(text.split())
+
+
+def _option_label(opt):
+    """
+    Label of one metadata option, or None to drop it. Dict options need a
+    truthy label or value; plain strings are kept as-is, even when empty.
+    """
+    if isinstance(opt, dict):
+        return opt.get('label') or opt.get('value') or None
+    if isinstance(opt, str):
+        return opt
+    return None
 
 
 def extract_gig_data(gig):
     """
     Extract all important data from a gig for market research.
     Returns a clean, consolidated data structure.
+    
+    The container keys the scrapers always write (seller_info, gig_info,
+    packages, pricing, reviews, gallery, tags, metadata) are subscripted.
     """
     
     # === SELLER INFORMATION ===
-    seller_info = gig.get('seller_info', {})
-    preview_data = gig.get('preview_data', {})
+    seller_info = gig['seller_info']
+    preview = gig.get('preview_data') or _EMPTY
+    sget = seller_info.get
+    pget = preview.get
     
     # Handle rating which can be either a dict or a direct value or None
-    rating_value = seller_info.get('rating')
-    if isinstance(rating_value, dict):
-        rating = rating_value.get('score', 0)
-        rating_count = rating_value.get('count', 0)
+    rating_value = sget('rating')
+    if type(rating_value) is dict:
+        rating = rating_value.get('score') or 0
+        rating_count = rating_value.get('count') or 0
     else:
-        rating = rating_value if rating_value is not None else 0
-        rating_count = seller_info.get('ratings_count', 0)
+        rating = rating_value or 0
+        rating_count = sget('ratings_count') or 0
     
     # Get seller_level from preview_data (more reliable) or seller_info
-    seller_level = preview_data.get('seller_level', '') or seller_info.get('level', '') or seller_info.get('seller_level', '')
+    seller_level = pget('seller_level', '') or sget('level', '') or sget('seller_level', '')
     
     # Get seller description and convert to plain text
-    seller_desc = seller_info.get('description', '')
-    if seller_desc:
-        seller_desc_plain = re.sub(r'<[^>]+>', '', seller_desc)
-        seller_desc_plain = re.sub(r'\s+', ' ', seller_desc_plain).strip()
-    else:
-        seller_desc_plain = ''
+    seller_desc = sget('description', '')
+    seller_desc_plain = _plain(seller_desc) if seller_desc else ''
     
     seller_data = {
-        'username': seller_info.get('username', '') or preview_data.get('seller_name', ''),
-        'seller_id': seller_info.get('seller_id', ''),
+        'username': sget('username', '') or pget('seller_name', ''),
+        'seller_id': sget('seller_id', ''),
         'seller_level': seller_level,  # Now gets it from preview_data first!
         'rating': rating,
         'ratings_count': rating_count,
-        'is_pro': seller_info.get('is_pro', False),
-        'country': seller_info.get('country', '') or seller_info.get('country_code', '') or preview_data.get('seller_country', ''),
-        'member_since': seller_info.get('member_since', ''),
-        'response_time': seller_info.get('response_time', 0),
-        'one_liner': seller_info.get('one_liner', ''),
+        'is_pro': sget('is_pro', False),
+        'country': sget('country', '') or sget('country_code', '') or pget('seller_country', ''),
+        'member_since': sget('member_since', ''),
+        'response_time': sget('response_time', 0),
+        'one_liner': sget('one_liner', ''),
         'description': seller_desc_plain
     }
     
     # === GIG INFORMATION ===
-    gig_info = gig.get('gig_info', {})
+    gig_info = gig['gig_info']
+    gget = gig_info.get
     gig_data = {
-        'gig_id': gig_info.get('gig_id', ''),
+        'gig_id': gget('gig_id', ''),
         'title': gig.get('title', ''),
-        'rating': gig_info.get('rating', 0),
-        'ratings_count': gig_info.get('ratings_count', 0),
+        'rating': gget('rating', 0),
+        'ratings_count': gget('ratings_count', 0),
         'orders_in_queue': gig.get('orders_in_queue', 0),
-        'collected_count': gig_info.get('collected_count', 0),  # favorites/saves
-        'category': gig_info.get('category', {}).get('name', ''),
-        'sub_category': gig_info.get('sub_category', {}).get('name', ''),
-        'nested_sub_category': gig_info.get('nested_sub_category', {}).get('name', ''),
-        'is_restricted': gig_info.get('is_restricted', False),
+        'collected_count': gget('collected_count', 0),  # favorites/saves
+        'category': (gget('category') or _EMPTY).get('name', ''),
+        'sub_category': (gget('sub_category') or _EMPTY).get('name', ''),
+        'nested_sub_category': (gget('nested_sub_category') or _EMPTY).get('name', ''),
+        'is_restricted': gget('is_restricted', False),
         'gig_url': gig.get('raw_url', '')
     }
     
     # === DESCRIPTION - PLAIN TEXT ONLY ===
     description = gig.get('description', '')
-    if description:
-        # Remove HTML tags for analysis
-        plain_description = re.sub(r'<[^>]+>', '', description)
-        plain_description = re.sub(r'\s+', ' ', plain_description).strip()
-    else:
-        plain_description = ''
+    # Remove HTML tags for analysis
+    plain_description = _plain(description) if description else ''
     
     description_data = {
         'description': plain_description,  # Just plain text
-        'word_count': len(plain_description.split()) if plain_description else 0,
+        # _plain() leaves single spaces between words, so spaces + 1 = words
+        'word_count': plain_description.count(' ') + 1 if plain_description else 0,
         'short_description': gig.get('short_description', '')
     }
     
     # === TAGS ===
-    tags = gig.get('tags', [])
+    tags = gig['tags']
     tags_list = [tag.get('name', '') for tag in tags if tag.get('name')]
     
     # === PACKAGES ===
-    packages = gig.get('packages', [])
+    packages = gig['packages']
     packages_data = []
     
     for package in packages:
-        pkg = {
-            'tier': package.get('name', ''),
-            'title': package.get('title', ''),
-            'description': package.get('description', ''),
-            'price': package.get('price', 0) or 0,
-            'delivery_time_days': package.get('delivery_time_days', 0) or 0,
-            'revisions': package.get('revisions', 0) or 0,
-            'revisions_unlimited': package.get('revisions_unlimited', False),
-            'features': {}  # Will be populated as clean dict
-        }
-        
         # Extract features - SIMPLIFIED to key-value pairs
         features_dict = {}
-        for feature in package.get('features', []):
+        for feature in package.get('features') or ():
             feature_name = feature.get('label', '') or feature.get('name', '')
             feature_value = feature.get('value', 0)
             feature_type = feature.get('type', '')
@@ -123,24 +160,34 @@ def extract_gig_data(gig):
                 if feature.get('included', False):
                     features_dict[feature_name] = feature_value if feature_value else True
         
-        pkg['features'] = features_dict  # Now a clean dict instead of array
+        pkg = {
+            'tier': package.get('name', ''),
+            'title': package.get('title', ''),
+            'description': package.get('description', ''),
+            'price': package.get('price', 0) or 0,
+            'delivery_time_days': package.get('delivery_time_days', 0) or 0,
+            'revisions': package.get('revisions', 0) or 0,
+            'revisions_unlimited': package.get('revisions_unlimited', False),
+            'features': features_dict  # Clean dict instead of array
+        }
         
         # Extra fast delivery - simplified
-        extra_fast = package.get('extra_fast_delivery', {})
-        if extra_fast and extra_fast.get('available'):
+        extra_fast = package.get('extra_fast_delivery') or _EMPTY
+        if extra_fast.get('available'):
             pkg['extra_fast_delivery_hours'] = extra_fast.get('duration_hours', 0)
             pkg['extra_fast_delivery_price'] = extra_fast.get('price', 0)
         
         packages_data.append(pkg)
     
     # === PRICING ===
-    pricing = gig.get('pricing', {})
+    pricing = gig['pricing']
+    prget = pricing.get
     pricing_data = {
-        'starting_price': pricing.get('starting_price', 0) or 0,
-        'highest_price': pricing.get('highest_price', 0) or 0,
-        'currency': pricing.get('currency', 'USD'),
-        'currency_symbol': pricing.get('currency_symbol', '$'),
-        'has_packages': pricing.get('has_packages', False)
+        'starting_price': prget('starting_price', 0) or 0,
+        'highest_price': prget('highest_price', 0) or 0,
+        'currency': prget('currency', 'USD'),
+        'currency_symbol': prget('currency_symbol', '$'),
+        'has_packages': prget('has_packages', False)
     }
     
     # Calculate price per day (value metric)
@@ -150,28 +197,30 @@ def extract_gig_data(gig):
         pricing_data['basic_price_per_day'] = 0
     
     # === REVIEWS SUMMARY ===
-    reviews = gig.get('reviews', {})
-    breakdown = reviews.get('breakdown', [])
+    reviews = gig['reviews']
+    rget = reviews.get
+    breakdown = rget('breakdown', [])
     simplified_breakdown = {str(item.get('average_valuation_value')): item.get('count', 0) for item in breakdown}
     
     reviews_data = {
-        'rating': reviews.get('rating', 0),
-        'reviews_count': reviews.get('reviews_count', 0),
+        'rating': rget('rating', 0),
+        'reviews_count': rget('reviews_count', 0),
         'star_breakdown': simplified_breakdown,
-        'star_summary': reviews.get('star_summary', {})
+        'star_summary': rget('star_summary', {})
     }
     
     # === GALLERY - SIMPLIFIED ===
-    gallery = gig.get('gallery', [])
+    gallery = gig['gallery']
+    video_count = sum(1 for item in gallery if item.get('is_video', False))
     gallery_data = {
         'total_items': len(gallery),
-        'has_video': any(item.get('is_video', False) for item in gallery),
-        'video_count': len([item for item in gallery if item.get('is_video', False)]),
-        'image_count': len([item for item in gallery if not item.get('is_video', False)])
+        'has_video': video_count > 0,
+        'video_count': video_count,
+        'image_count': len(gallery) - video_count
     }
     
     # === METADATA - SIMPLIFIED ===
-    metadata = gig.get('metadata', [])
+    metadata = gig['metadata'] or ()  # null when the gig page has no attributes
     metadata_data = {}
     for meta in metadata:
         meta_name = meta.get('name', '')
@@ -180,14 +229,7 @@ def extract_gig_data(gig):
         if options:
             # Extract just the labels from options
             if isinstance(options, list):
-                labels = []
-                for opt in options:
-                    if isinstance(opt, dict):
-                        label = opt.get('label', '') or opt.get('value', '')
-                        if label:
-                            labels.append(label)
-                    elif isinstance(opt, str):
-                        labels.append(opt)
+                labels = [label for label in map(_option_label, options) if label is not None]
                 
                 if labels:
                     metadata_data[meta_name] = labels
@@ -201,10 +243,9 @@ def extract_gig_data(gig):
     }
     
     # === PREVIEW DATA (from search results) ===
-    preview = gig.get('preview_data', {})
     preview_data = {
-        'search_price': preview.get('price', 0),
-        'seller_rating_in_search': preview.get('seller_rating', 0)
+        'search_price': pget('price', 0),
+        'seller_rating_in_search': pget('seller_rating', 0)
     }
     
     # === CONSOLIDATED GIG DATA ===
@@ -232,36 +273,54 @@ def calculate_keyword_statistics(all_gigs_data):
     if not all_gigs_data:
         return {}
     
-    # Pricing statistics
-    prices = [gig['pricing']['starting_price'] for gig in all_gigs_data 
-              if gig['pricing'].get('starting_price') and gig['pricing']['starting_price'] > 0]
+    # One walk over the gigs collects every numeric series (one list per
+    # metric) instead of re-scanning all_gigs_data for each statistic
+    prices, ratings, orders, delivery_times = [], [], [], []
+    pro_count = 0
+    for gig in all_gigs_data:
+        seller = gig['seller']
+        starting_price = gig['pricing'].get('starting_price')
+        if starting_price and starting_price > 0:
+            prices.append(starting_price)
+        rating = seller['rating']
+        if rating is not None and rating > 0:
+            ratings.append(rating)
+        in_queue = gig['gig'].get('orders_in_queue')
+        if in_queue is not None:
+            orders.append(in_queue)
+        if seller['is_pro']:
+            pro_count += 1
+        packages = gig['packages']
+        if packages:
+            # The basic tier is almost always listed first; scan only if not
+            basic_package = packages[0]
+            if basic_package['tier'].lower() != 'basic':
+                basic_package = next((p for p in packages if p['tier'].lower() == 'basic'), None)
+            if basic_package:
+                delivery_time = basic_package.get('delivery_time_days')
+                if delivery_time and delivery_time > 0:
+                    delivery_times.append(delivery_time)
     
     pricing_stats = {}
     if prices:
+        # Sort once: min/max/median are then index lookups, and each price
+        # range is the gap between two bisect positions
+        sorted_prices = sorted(prices)
+        cuts = [0, *(bisect_left(sorted_prices, bound) for bound in PRICE_RANGE_BOUNDS), len(prices)]
+        
         pricing_stats = {
             'average_price': round(sum(prices) / len(prices), 2),
-            'min_price': min(prices),
-            'max_price': max(prices),
-            'median_price': round(sorted(prices)[len(prices)//2], 2),
-            'price_ranges': {
-                'under_50': len([p for p in prices if p < 50]),
-                '50_to_100': len([p for p in prices if 50 <= p < 100]),
-                '100_to_250': len([p for p in prices if 100 <= p < 250]),
-                '250_to_500': len([p for p in prices if 250 <= p < 500]),
-                'over_500': len([p for p in prices if p >= 500])
-            }
+            'min_price': sorted_prices[0],
+            'max_price': sorted_prices[-1],
+            'median_price': round(sorted_prices[len(prices)//2], 2),
+            'price_ranges': {label: hi - lo for label, lo, hi in zip(PRICE_RANGE_LABELS, cuts, cuts[1:])}
         }
     
     # Seller level distribution (counts only, not averages)
-    levels = defaultdict(int)
-    for gig in all_gigs_data:
-        level = gig['seller']['seller_level']  # FIXED: was 'level'
-        if level:
-            levels[level] += 1
+    levels = Counter(level for gig in all_gigs_data
+                     if (level := gig['seller']['seller_level']))  # FIXED: was 'level'
     
     # Rating distribution
-    ratings = [gig['seller']['rating'] for gig in all_gigs_data 
-               if gig['seller']['rating'] is not None and gig['seller']['rating'] > 0]
     rating_stats = {}
     if ratings:
         rating_stats = {
@@ -271,8 +330,6 @@ def calculate_keyword_statistics(all_gigs_data):
         }
     
     # Orders in queue
-    orders = [gig['gig']['orders_in_queue'] for gig in all_gigs_data 
-              if gig['gig'].get('orders_in_queue') is not None]
     orders_stats = {
         'average_orders_in_queue': round(sum(orders) / len(orders), 2) if orders else 0,
         'max_orders_in_queue': max(orders) if orders else 0,
@@ -280,15 +337,6 @@ def calculate_keyword_statistics(all_gigs_data):
     }
     
     # Delivery time statistics
-    delivery_times = []
-    for gig in all_gigs_data:
-        if gig['packages']:
-            basic_package = next((p for p in gig['packages'] if p['tier'].lower() == 'basic'), None)
-            if basic_package:
-                delivery_time = basic_package.get('delivery_time_days')
-                if delivery_time and delivery_time > 0:
-                    delivery_times.append(delivery_time)
-    
     delivery_stats = {}
     if delivery_times:
         delivery_stats = {
@@ -297,27 +345,11 @@ def calculate_keyword_statistics(all_gigs_data):
             'max_delivery_time': max(delivery_times)
         }
     
-    # Pro sellers count
-    pro_count = sum(1 for gig in all_gigs_data if gig['seller']['is_pro'])
-    
-    # Tag frequency
-    all_tags = []
-    for gig in all_gigs_data:
-        all_tags.extend(gig['tags'])
-    
-    tag_frequency = defaultdict(int)
-    for tag in all_tags:
-        tag_frequency[tag] += 1
-    
-    # Sort tags by frequency
-    top_tags = sorted(tag_frequency.items(), key=lambda x: x[1], reverse=True)[:20]
+    # Tag frequency: top 20 tags (most_common(n) is a heap selection, not a full sort)
+    top_tags = Counter(chain.from_iterable(gig['tags'] for gig in all_gigs_data)).most_common(20)
     
     # Category distribution
-    categories = defaultdict(int)
-    for gig in all_gigs_data:
-        cat = gig['gig']['category']
-        if cat:
-            categories[cat] += 1
+    categories = Counter(cat for gig in all_gigs_data if (cat := gig['gig']['category']))
     
     statistics = {
         'total_gigs': len(all_gigs_data),
@@ -335,10 +367,49 @@ def calculate_keyword_statistics(all_gigs_data):
     return statistics
 
 
+def _list_gig_sources(keyword_path):
+    """
+    List the gigs stored in a keyword directory as (name, source) pairs:
+    the path of every gig_*.json file, plus the raw bytes of every line of
+    gigs.ndjson when the directory was scraped with --ndjson.
+    """
+    # One scandir pass; the gig_ prefix already excludes debug_*.json dumps
+    with os.scandir(keyword_path) as entries:
+        sources = [(entry.name, entry.path) for entry in entries
+                   if entry.name.startswith('gig_') and entry.name.endswith('.json') and entry.is_file()]
+    
+    ndjson_file = keyword_path / NDJSON_FILENAME
+    if ndjson_file.is_file():
+        with open(ndjson_file, 'rb') as f:
+            sources.extend((f"{NDJSON_FILENAME} line {n}", line)
+                           for n, line in enumerate(f, 1) if line.strip())
+    
+    return sources
+
+
+def _load_gig(source):
+    """Parse one raw gig from a gig file path or a gigs.ndjson line."""
+    if not isinstance(source, bytes):
+        source = Path(source).read_bytes()
+    return loads(source)
+
+
+def _load_and_extract(source):
+    """
+    Load one raw gig and extract its consolidated data. Runs in worker
+    processes, so errors are returned instead of raised to keep the rest
+    of the directory going. Returns (consolidated_data, error_message).
+    """
+    try:
+        return extract_gig_data(_load_gig(source)), None
+    except Exception as e:
+        return None, str(e)
+
+
 def process_keyword_directory(keyword_dir):
     """
     Process all gig JSON files in a keyword directory.
-    Returns consolidated data for all gigs.
+    Returns consolidated data for all gigs, one record per gig_id.
     """
     keyword_path = Path(keyword_dir)
     
@@ -349,36 +420,57 @@ def process_keyword_directory(keyword_dir):
     print(f"\n📁 Processing directory: {keyword_path}")
     
     all_gigs_data = []
+    gig_positions = {}  # gig_id -> index in all_gigs_data
     processed_count = 0
+    duplicate_count = 0
     error_count = 0
     
-    # Get all JSON files (exclude debug files)
-    json_files = [f for f in keyword_path.glob("gig_*.json") if not f.name.startswith("debug_")]
+    gig_sources = _list_gig_sources(keyword_path)
     
-    if not json_files:
+    if not gig_sources:
         print(f"❌ No gig JSON files found in {keyword_path}")
         return None, None
     
-    print(f"📄 Found {len(json_files)} gig files")
+    print(f"📄 Found {len(gig_sources)} gigs")
+    
+    # Parse + extract is CPU-bound, so large directories are spread over
+    # worker processes; small ones (or single-CPU hosts) stay serial
+    sources = [source for _, source in gig_sources]
+    use_pool = len(sources) >= PARALLEL_MIN_GIGS and (os.cpu_count() or 1) > 1
     
-    for json_file in json_files:
-        try:
-            with open(json_file, 'r', encoding='utf-8') as f:
-                gig = json.load(f)
+    with (ProcessPoolExecutor() if use_pool else nullcontext()) as executor:
+        if use_pool:
+            results = executor.map(_load_and_extract, sources, chunksize=64)
+        else:
+            results = map(_load_and_extract, sources)
+        
+        for (name, _), (consolidated_data, error) in zip(gig_sources, results):
+            if error is not None:
+                print(f"  ⚠️  Error processing {name}: {error}")
+                error_count += 1
+                continue
             
-            # Extract consolidated data
-            consolidated_data = extract_gig_data(gig)
-            all_gigs_data.append(consolidated_data)
+            # gigs.ndjson is append-only, so re-scraping a keyword (or using
+            # both layouts) repeats gigs. Keep the last record per gig_id --
+            # files first, then NDJSON lines in append order -- the same way
+            # a re-scrape overwrites a per-gig file.
+            gig_id = consolidated_data['gig']['gig_id']
+            has_id = gig_id not in ('', None)
+            if has_id and gig_id in gig_positions:
+                all_gigs_data[gig_positions[gig_id]] = consolidated_data
+                duplicate_count += 1
+            else:
+                if has_id:
+                    gig_positions[gig_id] = len(all_gigs_data)
+                all_gigs_data.append(consolidated_data)
             processed_count += 1
             
             if processed_count % 10 == 0:
-                print(f"  ✓ Processed {processed_count}/{len(json_files)} gigs...")
-                
-        except Exception as e:
-            print(f"  ⚠️  Error processing {json_file.name}: {e}")
-            error_count += 1
+                print(f"  ✓ Processed {processed_count}/{len(gig_sources)} gigs...")
     
-    print(f"\n✅ Successfully processed: {processed_count}/{len(json_files)} gigs")
+    print(f"\n✅ Successfully processed: {processed_count}/{len(gig_sources)} gigs")
+    if duplicate_count > 0:
+        print(f"🔁 Duplicate records replaced by a later one: {duplicate_count}")
     if error_count > 0:
         print(f"⚠️  Errors: {error_count}")
     
@@ -388,26 +480,37 @@ def process_keyword_directory(keyword_dir):
     return all_gigs_data, statistics
 
 
-def save_consolidated_data(keyword_name, all_gigs_data, statistics, output_dir):
+def save_consolidated_data(keyword_name, all_gigs_data, statistics, output_dir, pretty=False):
     """
     Save consolidated data to a single JSON file.
+    Compact by default (one gig per line); pretty=True indents the whole document.
     """
     output_path = Path(output_dir)
     output_path.mkdir(parents=True, exist_ok=True)
     
-    # Create the consolidated data structure
-    consolidated = {
-        'keyword': keyword_name,
-        'analysis_date': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-        'statistics': statistics,
-        'gigs': all_gigs_data
-    }
-    
     # Save to JSON file
     output_file = output_path / f"{keyword_name}_analysis.json"
-    
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(consolidated, f, indent=2, ensure_ascii=False)
+    analysis_date = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    
+    # 1 MiB buffer: the compact path issues one small write per gig
+    with open(output_file, 'wb', buffering=WRITE_BUFFER_SIZE) as f:
+        if pretty:
+            f.write(dumps({
+                'keyword': keyword_name,
+                'analysis_date': analysis_date,
+                'statistics': statistics,
+                'gigs': all_gigs_data
+            }, pretty=True))
+        else:
+            # Serialize piecewise: header fields first, then one compact gig per
+            # line. all_gigs_data is still fully in memory; this only avoids
+            # building the whole serialized report as one bytes object
+            f.write(b'{"keyword":%s,"analysis_date":%s,"statistics":%s,"gigs":['
+                    % (dumps(keyword_name), dumps(analysis_date), dumps(statistics)))
+            for i, gig in enumerate(all_gigs_data):
+                f.write(b',\n' if i else b'\n')
+                f.write(dumps(gig))
+            f.write(b'\n]}\n')
     
     print(f"\n💾 Consolidated data saved: {output_file}")
     print(f"   File size: {output_file.stat().st_size / 1024:.2f} KB")
@@ -469,6 +572,7 @@ def main():
 Examples:
   python analyze_keyword_consolidated.py gigs_data/custom_website_development
   python analyze_keyword_consolidated.py gigs_data/logo_design --output analysis_results
+  python analyze_keyword_consolidated.py gigs_data/logo_design --pretty
   
   # Process multiple keywords
   python analyze_keyword_consolidated.py gigs_data/keyword1 gigs_data/keyword2
@@ -478,6 +582,8 @@ Examples:
     parser.add_argument('directories', nargs='+', help='Keyword directory/directories to process')
     parser.add_argument('--output', '-o', default='keyword_analysis', 
                        help='Output directory for consolidated JSON files')
+    parser.add_argument('--pretty', action='store_true',
+                       help='Indent the consolidated JSON (default: compact, one gig per line)')
     
     args = parser.parse_args()
     
@@ -498,7 +604,8 @@ Examples:
                 keyword_name, 
                 all_gigs_data, 
                 statistics, 
-                args.output
+                args.output,
+                pretty=args.pretty
             )
             
             # Print summary
@@ -14,12 +14,13 @@ Usage:
   python extract_keywords.py "keyword_analysis/custom website development_analysis.json" --output my_keywords.txt
 """
 
-import json
 import sys
 import os
 import argparse
 from pathlib import Path
 
+from fiverr.utils.json_utils import loads
+
 
 def extract_keywords(input_file, output_file=None):
     input_path = Path(input_file)
@@ -27,8 +28,7 @@ def extract_keywords(input_file, output_file=None):
         print(f"[ERROR] File not found: {input_file}")
         sys.exit(1)
 
-    with open(input_path, encoding='utf-8') as f:
-        data = json.load(f)
+    data = loads(input_path.read_bytes())
 
     gigs = data.get('gigs', [])
     keyword = data.get('keyword', input_path.stem)
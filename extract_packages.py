@@ -16,11 +16,12 @@ Usage:
   python extract_packages.py "keyword_analysis/custom website development_analysis.json" --output my_packages.txt
 """
 
-import json
 import sys
 import argparse
 from pathlib import Path
 
+from fiverr.utils.json_utils import loads
+
 
 def format_features(features):
     """Turn the features dict into readable lines."""
@@ -41,8 +42,7 @@ def extract_packages(input_file, output_file=None):
         print(f"[ERROR] File not found: {input_file}")
         sys.exit(1)
 
-    with open(input_path, encoding='utf-8') as f:
-        data = json.load(f)
+    data = loads(input_path.read_bytes())
 
     gigs = data.get('gigs', [])
     keyword = data.get('keyword', input_path.stem)
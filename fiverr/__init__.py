@@ -1 +1,7 @@
-from fiverr.utils.req import session
+def __getattr__(name):
+    # Import the HTTP session (requests + BeautifulSoup) only when it is
+    # used, so the JSON helpers under fiverr.utils stay cheap to import.
+    if name == 'session':
+        from fiverr.utils.req import session
+        return session
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,30 @@
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def dumps(obj, pretty: bool = False) -> bytes:
+    """
+    Serialize `obj` to UTF-8 encoded JSON bytes, pretty-printed with two
+    spaces when `pretty` is set. Uses orjson when it is installed.
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option)
+    if pretty:
+        text = json.dumps(obj, indent=2, ensure_ascii=False)
+    else:
+        text = json.dumps(obj, separators=(',', ':'), ensure_ascii=False)
+    return text.encode('utf-8')
+
+
+def loads(data: bytes | str):
+    """Parse JSON from `bytes` or `str`. Uses orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -1,6 +1,7 @@
 import re
 
 import requests
+from requests.adapters import HTTPAdapter
 from bs4 import BeautifulSoup
 
 from fiverr.utils.scrape_utils import get_perseus_initial_props
@@ -8,6 +9,10 @@ from fiverr.utils.scrape_utils import get_perseus_initial_props
 SCRAPER_API_URL = "https://api.scraperapi.com/"
 SCRAPER_API_REF = "https://www.scraperapi.com/?fp_ref=enable-fiverr-api"
 
+# Keep-alive connections kept open per host. Sized for the scrapers'
+# parallel gig workers so every worker reuses a pooled TCP/TLS connection.
+POOL_MAXSIZE = 16
+
 
 # ---------------------------------------------------------------------------
 # ScraperAPI-specific exceptions
@@ -68,6 +73,9 @@ class Session(requests.Session):
         self.country_code = "us"
         self.device_type = "desktop"
         self.session_number = 1
+        adapter = HTTPAdapter(pool_maxsize=POOL_MAXSIZE)
+        self.mount("https://", adapter)
+        self.mount("http://", adapter)
 
     def request(
             self,
@@ -87,6 +87,33 @@ def run_process(cmd, on_done):
             job['done'] = True
 
 
+def _count_keyword_gigs(folder):
+    """
+    Number of distinct gigs in a keyword folder, one per gig_id as
+    analyze_keyword.py counts them: gigs.ndjson is append-only, so a
+    re-scrape with --ndjson repeats gigs already on disk. gig_*.json files
+    are keyed by the id in their name (gig_<id>_<seller>.json).
+    """
+    gig_ids = {os.path.basename(path).split('_', 2)[1]
+               for path in glob.glob(os.path.join(folder, 'gig_*.json'))}
+    without_id = 0
+    ndjson_file = os.path.join(folder, 'gigs.ndjson')
+    if os.path.isfile(ndjson_file):
+        with open(ndjson_file, 'rb') as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    gig_id = json.loads(line)['gig_info'].get('gig_id')
+                except (ValueError, KeyError, TypeError, AttributeError):
+                    continue  # analyze_keyword.py skips unreadable lines too
+                if gig_id in ('', None):
+                    without_id += 1
+                else:
+                    gig_ids.add(str(gig_id))
+    return len(gig_ids) + without_id
+
+
 @app.route('/')
 def index():
     return render_template('index.html')
@@ -99,8 +126,7 @@ def get_keywords():
         for d in sorted(os.listdir(GIGS_DIR)):
             full = os.path.join(GIGS_DIR, d)
             if os.path.isdir(full):
-                count = len(glob.glob(os.path.join(full, '*.json')))
-                keywords.append({'name': d, 'count': count})
+                keywords.append({'name': d, 'count': _count_keyword_gigs(full)})
     return jsonify(keywords)
 
 